@@ -82,95 +82,127 @@ _TXT_COLORS = {
     (128,128,255):"LightBlue",(192,192,192):"Silver",
 }
 
-def _rgb(color_int):
-    return (color_int & 255, (color_int >> 8) & 255, (color_int >> 16) & 255)
+# LINE_COLOR stores colours as r | g << 8 | b << 16; key the lookups on that raw value
+_DIM_COLORS_BY_INT = dict(((r | g << 8 | b << 16), name) for (r, g, b), name in _DIM_COLORS.items())
+_TXT_COLORS_BY_INT = dict(((r | g << 8 | b << 16), name) for (r, g, b), name in _TXT_COLORS.items())
+
+# Characters Revit rejects in type names; compiled once, used for every type renamed
+_ILLEGAL_NAME_RE = re.compile(r'[\\/:?"<>|=]')
 
 def _sanitize(v):
+    """Strip illegal characters; None if nothing usable is left."""
     if not v:
-        return "N/A"
-    return re.sub(r'[\\/:?"<>|=]', '', v).strip() or "N/A"
+        return None
+    return _ILLEGAL_NAME_RE.sub('', v).strip() or None
 
 def _mm(param):
     return "{:.2f}mm".format(round(param.AsDouble() * 304.8, 2))
 
+def _read_params(elem, spec):
+    """Read every (key, bip, reader, missing) entry of spec in one pass.
+
+    get_Parameter returns None for a parameter the type doesn't have, so
+    no exception handling is needed here.
+    """
+    get = elem.get_Parameter
+    values = {}
+    for key, bip, reader, missing in spec:
+        p = get(bip)
+        values[key] = reader(p) if p is not None else missing
+    return values
+
+def _flag(param):
+    return param.AsInteger() == 1
+
 
 # ============================================================
 # DIMENSION RENAME HELPERS
 # ============================================================
-def _dim_name(dt, origin):
-    def gp(bip):
-        try: return dt.get_Parameter(bip)
-        except: return None
-
-    discipline = "STR" if "STR" in origin.upper() else "ARC"
-    p = gp(BuiltInParameter.TEXT_SIZE)
-    size  = _mm(p) if p else "N/A"
-    p = gp(BuiltInParameter.TEXT_FONT)
-    font  = p.AsString() if p else "N/A"
-    p = gp(BuiltInParameter.DIM_TEXT_BACKGROUND)
-    bg    = p.AsValueString() if p else "N/A"
-    p = gp(BuiltInParameter.LINE_COLOR)
-    color = _DIM_COLORS.get(_rgb(p.AsInteger()), "RGB") if p else "N/A"
-    p = gp(BuiltInParameter.DIM_PREFIX)
-    pref  = _sanitize(p.AsString()) if p else "N/A"
-    p = gp(BuiltInParameter.DIM_STYLE_CENTERLINE_SYMBOL)
-    ctr   = "Center" if (p and p.AsElementId() != ElementId.InvalidElementId) else "N/A"
-    p = gp(BuiltInParameter.SPOT_ELEV_IND_ELEVATION)
-    elev  = _sanitize(p.AsString()) if p else "N/A"
-    p = gp(BuiltInParameter.SPOT_ELEV_IND_TOP)
-    top   = _sanitize(p.AsString()) if p else "N/A"
-    p = gp(BuiltInParameter.SPOT_ELEV_IND_BOTTOM)
-    bot   = _sanitize(p.AsString()) if p else "N/A"
-
-    parts = ["LB", discipline, size, font, bg]
-    if color != "Black": parts.append(color)
-    if ctr  != "N/A":   parts.append(ctr)
-    if pref != "N/A":   parts.append(pref)
-    if elev != "N/A":
-        parts.append(elev)
-    else:
-        if top != "N/A": parts.append(top)
-        if bot != "N/A": parts.append(bot)
+_DIM_PARAM_SPEC = (
+    ("size",  BuiltInParameter.TEXT_SIZE,                   _mm,                                 "N/A"),
+    ("font",  BuiltInParameter.TEXT_FONT,                   lambda p: p.AsString(),              "N/A"),
+    ("bg",    BuiltInParameter.DIM_TEXT_BACKGROUND,         lambda p: p.AsValueString(),         "N/A"),
+    ("color", BuiltInParameter.LINE_COLOR,
+        lambda p: _DIM_COLORS_BY_INT.get(p.AsInteger(), "RGB"),                                   "N/A"),
+    # Optional suffixes below read as None when absent and are left out of the name
+    ("pref",  BuiltInParameter.DIM_PREFIX,                  lambda p: _sanitize(p.AsString()),   None),
+    ("ctr",   BuiltInParameter.DIM_STYLE_CENTERLINE_SYMBOL,
+        lambda p: "Center" if p.AsElementId() != ElementId.InvalidElementId else None,           None),
+    ("elev",  BuiltInParameter.SPOT_ELEV_IND_ELEVATION,     lambda p: _sanitize(p.AsString()),   None),
+    ("top",   BuiltInParameter.SPOT_ELEV_IND_TOP,           lambda p: _sanitize(p.AsString()),   None),
+    ("bot",   BuiltInParameter.SPOT_ELEV_IND_BOTTOM,        lambda p: _sanitize(p.AsString()),   None),
+)
+
+def _discipline(type_name):
+    return "STR" if "STR" in type_name.upper() else "ARC"
+
+def _dim_name(dt, discipline):
+    v = _read_params(dt, _DIM_PARAM_SPEC)
+    elev = v["elev"]
+
+    parts = ["LB", discipline, v["size"], v["font"], v["bg"]]
+    if v["color"] != "Black": parts.append(v["color"])
+    extras = (v["ctr"], v["pref"]) + ((elev,) if elev else (v["top"], v["bot"]))
+    parts.extend(x for x in extras if x)
     return "_".join(parts)
 
 
 # ============================================================
 # TEXTNOTE RENAME HELPERS
 # ============================================================
-def _txt_name(tt, origin):
-    def gp(bip):
-        try: return tt.get_Parameter(bip)
-        except: return None
-
-    discipline = "STR" if "STR" in origin.upper() else "ARC"
-    p = gp(BuiltInParameter.TEXT_SIZE)
-    size   = _mm(p) if p else "N/A"
-    p = gp(BuiltInParameter.TEXT_FONT)
-    font   = p.AsString().replace(" ", "") if p else "N/A"
-    p = gp(BuiltInParameter.TEXT_BACKGROUND)
-    bg     = ("Opaque" if p.AsInteger() == 0 else "Transparent") if p else "N/A"
-    p = gp(BuiltInParameter.TEXT_WIDTH_SCALE)
-    factor = str(round(p.AsDouble(), 2)) if p else "N/A"
-    p = gp(BuiltInParameter.LINE_COLOR)
-    color  = _TXT_COLORS.get(_rgb(p.AsInteger()), "RGB") if p else "N/A"
-    p = gp(BuiltInParameter.TEXT_BOX_VISIBILITY)
-    border = p and p.AsInteger() == 1
-    p = gp(BuiltInParameter.TEXT_STYLE_BOLD)
-    bold   = p and p.AsInteger() == 1
-    p = gp(BuiltInParameter.TEXT_STYLE_UNDERLINE)
-    uline  = p and p.AsInteger() == 1
-    p = gp(BuiltInParameter.TEXT_STYLE_ITALIC)
-    italic = p and p.AsInteger() == 1
-
-    parts = ["LB", discipline, size, font, bg, factor]
-    if color != "Black": parts.append(color)
-    if border:  parts.append("Border")
-    if bold:    parts.append("B")
-    if uline:   parts.append("U")
-    if italic:  parts.append("I")
+_TXT_PARAM_SPEC = (
+    ("size",   BuiltInParameter.TEXT_SIZE,            _mm,                                      "N/A"),
+    ("font",   BuiltInParameter.TEXT_FONT,            lambda p: p.AsString().replace(" ", ""),  "N/A"),
+    ("bg",     BuiltInParameter.TEXT_BACKGROUND,
+        lambda p: "Opaque" if p.AsInteger() == 0 else "Transparent",                            "N/A"),
+    ("factor", BuiltInParameter.TEXT_WIDTH_SCALE,     lambda p: str(round(p.AsDouble(), 2)),    "N/A"),
+    ("color",  BuiltInParameter.LINE_COLOR,
+        lambda p: _TXT_COLORS_BY_INT.get(p.AsInteger(), "RGB"),                                  "N/A"),
+    ("border", BuiltInParameter.TEXT_BOX_VISIBILITY,  _flag,                                    False),
+    ("bold",   BuiltInParameter.TEXT_STYLE_BOLD,      _flag,                                    False),
+    ("uline",  BuiltInParameter.TEXT_STYLE_UNDERLINE, _flag,                                    False),
+    ("italic", BuiltInParameter.TEXT_STYLE_ITALIC,    _flag,                                    False),
+)
+
+def _txt_name(tt, discipline):
+    v = _read_params(tt, _TXT_PARAM_SPEC)
+
+    parts = ["LB", discipline, v["size"], v["font"], v["bg"], v["factor"]]
+    if v["color"] != "Black": parts.append(v["color"])
+    if v["border"]:  parts.append("Border")
+    if v["bold"]:    parts.append("B")
+    if v["uline"]:   parts.append("U")
+    if v["italic"]:  parts.append("I")
     return "_".join(parts)
 
 
+# ============================================================
+# RENAME-ALL
+# ============================================================
+def _apply_renames(renames, title):
+    """Assign (type, new_name) pairs in one transaction, skipping no-ops.
+
+    Names are computed before the transaction opens so it only holds the
+    writes; returns the number of types actually renamed.
+    """
+    pending = [(elem, name) for elem, name in renames if elem.Name != name]
+    if not pending:
+        return 0
+    count = 0
+    t = Transaction(doc, title)
+    t.Start()
+    try:
+        for elem, name in pending:
+            try:
+                elem.Name = name
+                count += 1
+            except Exception:
+                pass
+    finally:
+        t.Commit()
+    return count
+
+
 # ============================================================
 # XAML PATH
 # ============================================================
@@ -247,33 +279,27 @@ class AnnotationManagerWindow(forms.WPFWindow):
     @staticmethod
     def _get_dim_params(dt):
         """Extract common params from a DimensionType element."""
-        def gp(bip):
-            try: return dt.get_Parameter(bip)
-            except: return None
-        p = gp(BuiltInParameter.TEXT_SIZE)
+        p = dt.get_Parameter(BuiltInParameter.TEXT_SIZE)
         size = _mm(p) if p else ""
-        p = gp(BuiltInParameter.TEXT_FONT)
+        p = dt.get_Parameter(BuiltInParameter.TEXT_FONT)
         font = p.AsString() if p else ""
-        p = gp(BuiltInParameter.DIM_TEXT_BACKGROUND)
+        p = dt.get_Parameter(BuiltInParameter.DIM_TEXT_BACKGROUND)
         bg = p.AsValueString() if p else ""
-        p = gp(BuiltInParameter.LINE_COLOR)
-        color = _DIM_COLORS.get(_rgb(p.AsInteger()), "RGB") if p else ""
+        p = dt.get_Parameter(BuiltInParameter.LINE_COLOR)
+        color = _DIM_COLORS_BY_INT.get(p.AsInteger(), "RGB") if p else ""
         return size, font, bg, color
 
     @staticmethod
     def _get_txt_params(tt):
         """Extract common params from a TextNoteType element."""
-        def gp(bip):
-            try: return tt.get_Parameter(bip)
-            except: return None
-        p = gp(BuiltInParameter.TEXT_SIZE)
+        p = tt.get_Parameter(BuiltInParameter.TEXT_SIZE)
         size = _mm(p) if p else ""
-        p = gp(BuiltInParameter.TEXT_FONT)
+        p = tt.get_Parameter(BuiltInParameter.TEXT_FONT)
         font = p.AsString() if p else ""
-        p = gp(BuiltInParameter.TEXT_BACKGROUND)
+        p = tt.get_Parameter(BuiltInParameter.TEXT_BACKGROUND)
         bg = ("Opaque" if p.AsInteger() == 0 else "Transparent") if p else ""
-        p = gp(BuiltInParameter.LINE_COLOR)
-        color = _TXT_COLORS.get(_rgb(p.AsInteger()), "RGB") if p else ""
+        p = tt.get_Parameter(BuiltInParameter.LINE_COLOR)
+        color = _TXT_COLORS_BY_INT.get(p.AsInteger(), "RGB") if p else ""
         return size, font, bg, color
 
     def _load_all_dims(self):
@@ -541,20 +567,15 @@ class AnnotationManagerWindow(forms.WPFWindow):
         if not pf.alert("Auto-rename ALL DimensionTypes in this document?\nThis cannot be undone.",
                         title="Confirm Rename", yes=True, no=True):
             return
-        t = Transaction(doc, "Rename Dimension Types")
-        t.Start()
-        count = 0
-        try:
-            for dt in FilteredElementCollector(doc).OfClass(DimensionType)\
-                      .WhereElementIsElementType().ToElements():
-                try:
-                    origin = dt.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME).AsString()
-                    dt.Name = _dim_name(dt, origin)
-                    count += 1
-                except Exception:
-                    pass
-        finally:
-            t.Commit()
+        renames = []
+        for dt in FilteredElementCollector(doc).OfClass(DimensionType)\
+                  .WhereElementIsElementType().ToElements():
+            try:
+                origin = dt.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME).AsString()
+                renames.append((dt, _dim_name(dt, _discipline(origin))))
+            except Exception:
+                pass
+        count = _apply_renames(renames, "Rename Dimension Types")
         self._status("Renamed {} DimensionType(s).".format(count))
 
     # ── TextNote sub-mode ────────────────────────────────────────────────
@@ -735,20 +756,15 @@ class AnnotationManagerWindow(forms.WPFWindow):
         if not pf.alert("Auto-rename ALL TextNoteTypes in this document?\nThis cannot be undone.",
                         title="Confirm Rename", yes=True, no=True):
             return
-        t = Transaction(doc, "Rename TextNote Types")
-        t.Start()
-        count = 0
-        try:
-            for tt in FilteredElementCollector(doc).OfClass(TextNoteType)\
-                      .WhereElementIsElementType().ToElements():
-                try:
-                    origin = tt.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME).AsString()
-                    tt.Name = _txt_name(tt, origin)
-                    count += 1
-                except Exception:
-                    pass
-        finally:
-            t.Commit()
+        renames = []
+        for tt in FilteredElementCollector(doc).OfClass(TextNoteType)\
+                  .WhereElementIsElementType().ToElements():
+            try:
+                origin = tt.get_Parameter(BuiltInParameter.ALL_MODEL_TYPE_NAME).AsString()
+                renames.append((tt, _txt_name(tt, _discipline(origin))))
+            except Exception:
+                pass
+        count = _apply_renames(renames, "Rename TextNote Types")
         self._status("Renamed {} TextNoteType(s).".format(count))
 
 
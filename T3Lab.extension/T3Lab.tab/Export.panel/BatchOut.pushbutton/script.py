@@ -19,6 +19,7 @@ __version__ = "1.0.0"
 # IMPORT LIBRARIES
 # ==================================================
 import os
+import re
 import sys
 import clr
 import json
@@ -30,13 +31,13 @@ clr.AddReference('PresentationFramework')
 clr.AddReference('PresentationCore')
 clr.AddReference('WindowsBase')
 clr.AddReference('System')
-from System.Windows.Forms import FolderBrowserDialog, DialogResult
+from System.Windows.Forms import FolderBrowserDialog, OpenFileDialog, SaveFileDialog, DialogResult
 from System.Windows import Visibility, WindowState
 from System.Windows.Media.Imaging import BitmapImage
-from System import Uri, UriKind, Action
+from System import Uri, UriKind, Action, TimeSpan
 from System.ComponentModel import INotifyPropertyChanged, PropertyChangedEventArgs
 from System.Threading import Thread, ThreadStart
-from System.Windows.Threading import DispatcherPriority
+from System.Windows.Threading import DispatcherPriority, DispatcherTimer
 
 from pyrevit import revit, DB, UI, forms, script
 from Autodesk.Revit.DB import (
@@ -57,6 +58,12 @@ lib_dir = os.path.join(extension_dir, 'lib')
 if lib_dir not in sys.path:
     sys.path.append(lib_dir)
 
+# GUI resources - resolved once at import instead of on every window/dialog open
+gui_dir = os.path.join(lib_dir, 'GUI')
+XAML_FILE = os.path.join(gui_dir, 'Tools', 'ExportManager.xaml')
+LOGO_FILE = os.path.join(gui_dir, 'T3Lab_logo.png')
+HAS_LOGO = os.path.exists(LOGO_FILE)
+
 try:
     from api_learner import SmartAPIAdapter, RevitAPILearner
     from api_updater import auto_check_and_update
@@ -87,8 +94,51 @@ output = script.get_output()
 # Get Revit version information
 REVIT_VERSION = int(revit.doc.Application.VersionNumber)  # e.g., 2023, 2024, 2025, 2026
 
+# Filename pattern helpers - compiled once at import, reused for every item
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")  # {ParamName} tokens in the naming pattern
+_INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')  # characters Windows rejects in filenames
+
+# Sheet placeholders backed by built-in parameters; read only when the pattern uses them
+_SHEET_BUILTIN_PLACEHOLDERS = (
+    ("Revision", DB.BuiltInParameter.SHEET_CURRENT_REVISION),
+    ("RevisionDate", DB.BuiltInParameter.SHEET_CURRENT_REVISION_DATE),
+    ("RevisionDescription", DB.BuiltInParameter.SHEET_CURRENT_REVISION_DESCRIPTION),
+    ("DrawnBy", DB.BuiltInParameter.SHEET_DRAWN_BY),
+    ("CheckedBy", DB.BuiltInParameter.SHEET_CHECKED_BY),
+    ("ApprovedBy", DB.BuiltInParameter.SHEET_APPROVED_BY),
+    ("IssueDate", DB.BuiltInParameter.SHEET_ISSUE_DATE),
+)
+
+# Closed generic type for ElementId lists, resolved once instead of per List[...] call
+ElementIdList = List[DB.ElementId]
+
 # CLASS/FUNCTIONS
 # ==================================================
+def _param_as_string(element, built_in_param):
+    """Return a built-in parameter's string value, or "" if missing or unset.
+
+    get_Parameter returns None for absent parameters rather than raising, so no
+    try/except is needed on this per-sheet path.
+    """
+    param = element.get_Parameter(built_in_param)
+    if param is not None and param.HasValue:
+        return param.AsString() or ""
+    return ""
+
+
+def _ensure_folder(path):
+    """Create path (and parents) unless it already exists.
+
+    IronPython 2.7's os.makedirs has no exist_ok, so attempt the create and only
+    stat the folder when it fails.
+    """
+    try:
+        os.makedirs(path)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+
+
 class SheetItem(forms.Reactive):
     """Represents a sheet item in the list - optimized for performance."""
     def __init__(self, sheet, is_selected=False, lazy=False):
@@ -96,6 +146,9 @@ class SheetItem(forms.Reactive):
         self.IsSelected = is_selected
         self.SheetNumber = sheet.SheetNumber
         self.SheetName = sheet.Name
+        # Lower-cased copies for search filtering (names can't change while the dialog is modal)
+        self._lc_number = self.SheetNumber.lower()
+        self._lc_name = self.SheetName.lower()
         self.Status = "Ready"
         self.Progress = 0
         self.Size = "-"
@@ -112,35 +165,12 @@ class SheetItem(forms.Reactive):
 
     def _load_revision_params(self):
         """Load revision and metadata parameters. Called deferred for fast startup."""
-        try:
-            rev_param = self.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_CURRENT_REVISION)
-            self.Revision = rev_param.AsString() if rev_param else ""
-        except:
-            self.Revision = ""
-
-        try:
-            rev_date_param = self.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_CURRENT_REVISION_DATE)
-            self.RevisionDate = rev_date_param.AsString() if rev_date_param else ""
-        except:
-            self.RevisionDate = ""
-
-        try:
-            rev_desc_param = self.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_CURRENT_REVISION_DESCRIPTION)
-            self.RevisionDescription = rev_desc_param.AsString() if rev_desc_param else ""
-        except:
-            self.RevisionDescription = ""
-
-        try:
-            drawn_param = self.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_DRAWN_BY)
-            self.DrawnBy = drawn_param.AsString() if drawn_param else ""
-        except:
-            self.DrawnBy = ""
-
-        try:
-            checked_param = self.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_CHECKED_BY)
-            self.CheckedBy = checked_param.AsString() if checked_param else ""
-        except:
-            self.CheckedBy = ""
+        sheet = self.Sheet
+        self.Revision = _param_as_string(sheet, DB.BuiltInParameter.SHEET_CURRENT_REVISION)
+        self.RevisionDate = _param_as_string(sheet, DB.BuiltInParameter.SHEET_CURRENT_REVISION_DATE)
+        self.RevisionDescription = _param_as_string(sheet, DB.BuiltInParameter.SHEET_CURRENT_REVISION_DESCRIPTION)
+        self.DrawnBy = _param_as_string(sheet, DB.BuiltInParameter.SHEET_DRAWN_BY)
+        self.CheckedBy = _param_as_string(sheet, DB.BuiltInParameter.SHEET_CHECKED_BY)
 
     def __repr__(self):
         return "{} - {}".format(self.SheetNumber, self.SheetName)
@@ -176,6 +206,10 @@ class ViewItem(forms.Reactive):
             self.ViewType = "Unknown"
         self.SheetName = self.ViewType
 
+        # Lower-cased copies for search filtering
+        self._lc_name = self.ViewName.lower()
+        self._lc_type = self.ViewType.lower()
+
         # Scale is a direct property — fast, always load
         try:
             self.Scale = "1:{}".format(view.Scale) if hasattr(view, 'Scale') and view.Scale else "-"
@@ -336,16 +370,14 @@ class ExportManagerWindow(forms.WPFWindow):
 
     def __init__(self):
         try:
-            # Get absolute path to XAML file from lib/GUI folder
-            extension_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-            xaml_file_path = os.path.join(extension_dir, 'lib', 'GUI', 'Tools', 'ExportManager.xaml')
-            forms.WPFWindow.__init__(self, xaml_file_path)
+            forms.WPFWindow.__init__(self, XAML_FILE)
 
             self.doc = revit.doc
             self.all_sheets = []
             self.filtered_sheets = []
             self.all_views = []
             self.filtered_views = []
+            self._views_by_type = defaultdict(list)  # ViewType label -> ViewItems, in all_views order
             self.export_items = []
             self.selection_mode = "sheets"  # "sheets" or "views"
             self.profiles = []  # List of ExportProfile objects
@@ -354,18 +386,28 @@ class ExportManagerWindow(forms.WPFWindow):
             # Performance optimization: caches for batch loading
             self._titleblock_size_cache = {}  # Sheet ID -> (width_mm, height_mm)
             self._paper_size_cache = {}  # Sheet ID -> (size_name, orientation)
+            self._pending_progress_updates = 0  # Export rows updated since last preview refresh
+            self._items_since_render = 0  # Items started this export, for throttled repaints
+            self._export_options = {}  # Format name -> export options for the current session
+            self._active_pattern = None  # Naming pattern _active_placeholders was parsed from
+            self._active_placeholders = frozenset()
+
+            # Debounce search-as-you-type: filter once typing pauses, not on every keystroke
+            self._search_timer = DispatcherTimer()
+            self._search_timer.Interval = TimeSpan.FromMilliseconds(self.SEARCH_DEBOUNCE_MS)
+            self._search_timer.Tick += self._search_timer_tick
 
             # Link naming pattern to the new UI control in Settings tab
             self.naming_pattern = self.naming_pattern_settings
             self.naming_pattern.Text = "{SheetNumber}-{SheetName}"
+            self._begin_naming_session()
 
             # Set window icon and title bar logo
             try:
-                logo_path = os.path.join(extension_dir, 'lib', 'GUI', 'T3Lab_logo.png')
-                if os.path.exists(logo_path):
+                if HAS_LOGO:
                     bitmap = BitmapImage()
                     bitmap.BeginInit()
-                    bitmap.UriSource = Uri(logo_path, UriKind.Absolute)
+                    bitmap.UriSource = Uri(LOGO_FILE, UriKind.Absolute)
                     bitmap.EndInit()
                     # Set window icon
                     self.Icon = bitmap
@@ -463,22 +505,20 @@ class ExportManagerWindow(forms.WPFWindow):
         """Load all saved profiles from disk."""
         try:
             # Create profiles folder if it doesn't exist
-            if not os.path.exists(self.profiles_folder):
-                os.makedirs(self.profiles_folder)
+            _ensure_folder(self.profiles_folder)
 
             # Load all JSON files from profiles folder
             self.profiles = []
-            if os.path.exists(self.profiles_folder):
-                for filename in os.listdir(self.profiles_folder):
-                    if filename.endswith('.json'):
-                        filepath = os.path.join(self.profiles_folder, filename)
-                        try:
-                            with open(filepath, 'r') as f:
-                                data = json.load(f)
-                                profile = ExportProfile.from_dict(data)
-                                self.profiles.append(profile)
-                        except Exception as file_ex:
-                            logger.warning("Could not load profile {}: {}".format(filename, file_ex))
+            for filename in os.listdir(self.profiles_folder):
+                if filename.endswith('.json'):
+                    filepath = os.path.join(self.profiles_folder, filename)
+                    try:
+                        with open(filepath, 'r') as f:
+                            data = json.load(f)
+                            profile = ExportProfile.from_dict(data)
+                            self.profiles.append(profile)
+                    except Exception as file_ex:
+                        logger.warning("Could not load profile {}: {}".format(filename, file_ex))
 
             # Update profiles listview (only if dialog is open)
             if hasattr(self, 'profiles_listview') and self.profiles_listview:
@@ -492,8 +532,7 @@ class ExportManagerWindow(forms.WPFWindow):
         """Save all profiles to disk."""
         try:
             # Create profiles folder if it doesn't exist
-            if not os.path.exists(self.profiles_folder):
-                os.makedirs(self.profiles_folder)
+            _ensure_folder(self.profiles_folder)
 
             # Save each profile as a JSON file
             for profile in self.profiles:
@@ -785,8 +824,6 @@ class ExportManagerWindow(forms.WPFWindow):
     def import_profile_clicked(self, sender, e):
         """Import profile from file."""
         try:
-            from System.Windows.Forms import OpenFileDialog, DialogResult
-
             # Show open file dialog
             dialog = OpenFileDialog()
             dialog.Title = "Import Profile"
@@ -834,8 +871,6 @@ class ExportManagerWindow(forms.WPFWindow):
                 forms.alert("Please select a profile to export.", title="No Profile Selected")
                 return
 
-            from System.Windows.Forms import SaveFileDialog, DialogResult
-
             # Show save file dialog
             dialog = SaveFileDialog()
             dialog.Title = "Export Profile"
@@ -1041,8 +1076,8 @@ class ExportManagerWindow(forms.WPFWindow):
                     item.Content = setup_name
                     item.Tag = setup  # Store the setup object for later use
                     self.cad_export_setup.Items.Add(item)
-                except:
-                    pass
+                except Exception as setup_ex:
+                    logger.debug("Skipping CAD export setup: {}".format(setup_ex))
 
             # Select the first item (default)
             self.cad_export_setup.SelectedIndex = 0
@@ -1320,6 +1355,11 @@ class ExportManagerWindow(forms.WPFWindow):
             self.all_views = [ViewItem(view, False, lazy=True) for view in views]
             self.filtered_views = list(self.all_views)
 
+            # Bucket by view type once so the type filter doesn't rescan every view
+            self._views_by_type = defaultdict(list)
+            for view_item in self.all_views:
+                self._views_by_type[view_item.ViewType].append(view_item)
+
             self.update_items_list()
             self.status_text.Text = "Loaded {} views | Revit {}".format(
                 len(self.all_views), REVIT_VERSION)
@@ -1749,8 +1789,19 @@ class ExportManagerWindow(forms.WPFWindow):
             logger.error("Error saving View/Sheet Set: {}".format(ex))
             forms.alert("Error saving View/Sheet Set:\n{}".format(str(ex)), title="Error")
 
+    # Delay between the last keystroke in the search box and the filter pass
+    SEARCH_DEBOUNCE_MS = 150
+
     def search_sheets(self, sender, e):
-        """Filter sheets by search text."""
+        """Filter sheets by search text (debounced - see _search_timer_tick)."""
+        if not hasattr(self, '_search_timer'):
+            return
+        self._search_timer.Stop()
+        self._search_timer.Start()
+
+    def _search_timer_tick(self, sender, e):
+        """Run the pending search once typing has paused."""
+        self._search_timer.Stop()
         self.apply_filters()
 
     def filter_by_size(self, sender, e):
@@ -1809,8 +1860,8 @@ class ExportManagerWindow(forms.WPFWindow):
 
                 # Check search text
                 if search_text:
-                    if search_text not in sheet.SheetNumber.lower() and \
-                       search_text not in sheet.SheetName.lower():
+                    if search_text not in sheet._lc_number and \
+                       search_text not in sheet._lc_name:
                         continue
 
                 self.filtered_sheets.append(sheet)
@@ -1831,18 +1882,18 @@ class ExportManagerWindow(forms.WPFWindow):
                 if type_text != "All Views":
                     view_type_filter = type_text
 
-            # Apply filters for views
+            # Apply filters for views - the type filter picks a precomputed bucket
+            if view_type_filter:
+                candidates = self._views_by_type.get(view_type_filter, [])
+            else:
+                candidates = self.all_views
+
             self.filtered_views = []
-            for view in self.all_views:
+            for view in candidates:
                 # Check search text
                 if search_text:
-                    if search_text not in view.ViewName.lower() and \
-                       search_text not in view.ViewType.lower():
-                        continue
-
-                # Check view type filter
-                if view_type_filter:
-                    if view.ViewType != view_type_filter:
+                    if search_text not in view._lc_name and \
+                       search_text not in view._lc_type:
                         continue
 
                 self.filtered_views.append(view)
@@ -1965,7 +2016,8 @@ class ExportManagerWindow(forms.WPFWindow):
         """
         try:
             # Import the parameter selector dialog
-            sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'lib', 'GUI'))
+            if gui_dir not in sys.path:
+                sys.path.insert(0, gui_dir)
             from ParameterSelectorDialog import ParameterSelectorDialog
 
             # Determine element type based on current selection mode
@@ -1982,6 +2034,7 @@ class ExportManagerWindow(forms.WPFWindow):
                 items_list = self.all_sheets if self.selection_mode == 'sheets' else self.all_views
 
                 # Apply the naming pattern to each item
+                self._begin_naming_session()
                 for item in items_list:
                     # Generate filename using the current naming pattern
                     filename = self.get_export_filename(item)
@@ -2005,7 +2058,8 @@ class ExportManagerWindow(forms.WPFWindow):
         """
         try:
             # Import the parameter selector dialog
-            sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'lib', 'GUI'))
+            if gui_dir not in sys.path:
+                sys.path.insert(0, gui_dir)
             from ParameterSelectorDialog import ParameterSelectorDialog
 
             # Determine element type based on current selection mode
@@ -2026,6 +2080,7 @@ class ExportManagerWindow(forms.WPFWindow):
                 items_list = self.all_sheets if self.selection_mode == 'sheets' else self.all_views
 
                 # Apply the naming pattern to each item
+                self._begin_naming_session()
                 for item in items_list:
                     # Generate filename using the current naming pattern
                     filename = self.get_export_filename(item)
@@ -2053,7 +2108,8 @@ class ExportManagerWindow(forms.WPFWindow):
                 return
 
             # Import the parameter selector dialog
-            sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'lib', 'GUI'))
+            if gui_dir not in sys.path:
+                sys.path.insert(0, gui_dir)
             from ParameterSelectorDialog import ParameterSelectorDialog
 
             # Determine element type based on current selection mode
@@ -2071,6 +2127,7 @@ class ExportManagerWindow(forms.WPFWindow):
                     self.naming_pattern.Text = pattern
 
                 # Generate filename using the selected pattern
+                self._begin_naming_session()
                 filename = self.get_export_filename(item)
 
                 # Restore the original pattern
@@ -2235,8 +2292,14 @@ class ExportManagerWindow(forms.WPFWindow):
     def build_export_preview(self):
         """Build the export preview list."""
         # Get selected items based on mode
+        skipped_placeholders = 0
         if self.selection_mode == "sheets":
             selected_items = [s for s in self.all_sheets if s.IsSelected]
+            # start_export skips placeholder sheets; leave them out of the preview too
+            # so its rows and the progress total match what is actually exported
+            exportable = [s for s in selected_items if not s.Sheet.IsPlaceholder]
+            skipped_placeholders = len(selected_items) - len(exportable)
+            selected_items = exportable
             # Sync cached sheet numbers with live values from Revit before building preview
             for sheet_item in selected_items:
                 sheet_item.SheetNumber = sheet_item.Sheet.SheetNumber
@@ -2289,6 +2352,81 @@ class ExportManagerWindow(forms.WPFWindow):
         # Update preview list
         self.export_preview_list.ItemsSource = self.export_items
         self.progress_text.Text = "Ready to export {} items".format(len(self.export_items))
+        if skipped_placeholders:
+            self.progress_text.Text += " ({} placeholder sheet(s) skipped)".format(skipped_placeholders)
+
+    def _begin_naming_session(self):
+        """Snapshot values shared by every filename in one batch.
+
+        Called at the start of each export / pattern-apply pass so all files in the
+        batch get the same timestamp and get_export_filename doesn't re-read the
+        date or ProjectInformation per item.
+        """
+        self._resolved_names = {}  # Element id -> (file name, root, extension) (see _get_item_filename)
+        self._synced_items = set()  # id() of items whose names were synced (see _sync_item_names)
+
+        now = datetime.now()
+        self._naming_date = now.strftime("%Y%m%d")
+        self._naming_time = now.strftime("%H%M%S")
+
+        try:
+            project_info = self.doc.ProjectInformation
+            self._project_number = project_info.Number or ""
+            self._project_name = project_info.Name or ""
+            self._project_address = project_info.Address or ""
+            self._client_name = project_info.ClientName or ""
+            self._project_status = project_info.Status or ""
+        except Exception as ex:
+            logger.debug("Could not read project information: {}".format(ex))
+            self._project_number = ""
+            self._project_name = ""
+            self._project_address = ""
+            self._client_name = ""
+            self._project_status = ""
+
+    def _get_active_placeholders(self, pattern):
+        """Return the set of placeholder names used in pattern, cached per pattern text."""
+        if pattern != self._active_pattern:
+            self._active_pattern = pattern
+            self._active_placeholders = frozenset(_PLACEHOLDER_RE.findall(pattern))
+        return self._active_placeholders
+
+    def _sync_item_names(self, items):
+        """Copy live sheet/view names onto the items, once per item per session.
+
+        Every exporter needs current names, but they can't change while an export
+        runs, so only the first exporter of a session pays the .NET reads and the
+        PropertyChanged notifications.
+        """
+        for item in items:
+            key = id(item)
+            if key in self._synced_items:
+                continue
+            if hasattr(item, 'Sheet'):
+                item.SheetNumber = item.Sheet.SheetNumber
+                item.SheetName = item.Sheet.Name
+            elif hasattr(item, 'View'):
+                item.SheetNumber = item.View.Name
+                item.ViewName = item.View.Name
+            self._synced_items.add(key)
+
+    def _get_item_filename(self, item, extension):
+        """Return item's export file name without extension, resolved once per session.
+
+        The same item passes through every enabled exporter, so the custom name or
+        naming-pattern result is cached by element id, split with its lower-cased
+        extension; per format only that extension is compared.
+        """
+        element = getattr(item, 'Sheet', None) or getattr(item, 'View', None)
+        key = element.Id.IntegerValue if element is not None else id(item)
+        resolved = self._resolved_names.get(key)
+        if resolved is None:
+            filename = item.CustomFilename or self.get_export_filename(item)
+            root, ext = os.path.splitext(filename)
+            resolved = (filename, root, ext.lower())
+            self._resolved_names[key] = resolved
+        filename, root, ext = resolved
+        return root if ext == extension else filename
 
     def get_export_filename(self, item):
         """Generate export filename based on naming pattern.
@@ -2299,21 +2437,7 @@ class ExportManagerWindow(forms.WPFWindow):
         Now supports ALL parameters dynamically.
         """
         pattern = self.naming_pattern.Text
-
-        # Get project info
-        try:
-            project_info = self.doc.ProjectInformation
-            project_number = project_info.Number or ""
-            project_name = project_info.Name or ""
-            project_address = project_info.Address or ""
-            client_name = project_info.ClientName or ""
-            project_status = project_info.Status or ""
-        except:
-            project_number = ""
-            project_name = ""
-            project_address = ""
-            client_name = ""
-            project_status = ""
+        active = self._get_active_placeholders(pattern)
 
         # Get the actual Revit element (sheet or view)
         element = None
@@ -2329,26 +2453,29 @@ class ExportManagerWindow(forms.WPFWindow):
             sheet_number = "Unknown"
             sheet_name = "Unknown"
 
-        # Build a dictionary of all standard replacements
+        # Build a dictionary of all standard replacements (keyed by placeholder name)
         replacements = {
-            "{SheetNumber}": sheet_number,
-            "{SheetName}": sheet_name,
-            "{ViewName}": sheet_number if hasattr(item, 'View') else "",
-            "{ProjectNumber}": project_number,
-            "{ProjectName}": project_name,
-            "{ProjectAddress}": project_address,
-            "{ClientName}": client_name,
-            "{ProjectStatus}": project_status,
-            "{Date}": datetime.now().strftime("%Y%m%d"),
-            "{Time}": datetime.now().strftime("%H%M%S"),
+            "SheetNumber": sheet_number,
+            "SheetName": sheet_name,
+            "ViewName": sheet_number if hasattr(item, 'View') else "",
+            "ProjectNumber": self._project_number,
+            "ProjectName": self._project_name,
+            "ProjectAddress": self._project_address,
+            "ClientName": self._client_name,
+            "ProjectStatus": self._project_status,
+            "Date": self._naming_date,
+            "Time": self._naming_time,
         }
 
-        # Get ALL parameters from the element dynamically
+        # Read only the element parameters the pattern actually references
+        # ({ParamName} tokens), instead of every parameter on the element
         if element:
             try:
-                for param in element.Parameters:
+                for param_name in active:
+                    param = element.LookupParameter(param_name)
+                    if param is None:
+                        continue
                     try:
-                        param_name = param.Definition.Name
                         param_value = ""
 
                         # Get parameter value based on storage type
@@ -2368,119 +2495,362 @@ class ExportManagerWindow(forms.WPFWindow):
                                     except:
                                         param_value = str(elem_id.IntegerValue)
 
-                        # Add to replacements dictionary
-                        # Support both {ParamName} format
-                        replacements["{" + param_name + "}"] = param_value
+                        # Add to replacements dictionary ({ParamName} in the pattern)
+                        replacements[param_name] = param_value
 
                     except Exception as param_ex:
                         # Skip problematic parameters
                         logger.debug("Could not read parameter {}: {}".format(
-                            param.Definition.Name if hasattr(param, 'Definition') else 'unknown',
-                            str(param_ex)
+                            param_name, str(param_ex)
                         ))
                         continue
             except Exception as params_ex:
-                logger.warning("Could not iterate parameters: {}".format(str(params_ex)))
+                logger.warning("Could not read pattern parameters: {}".format(str(params_ex)))
 
-        # Add common sheet-specific built-in parameters explicitly
+        # Add common sheet-specific built-in parameters explicitly (only those in the pattern)
         if hasattr(item, 'Sheet'):
-            try:
-                rev_param = item.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_CURRENT_REVISION)
-                replacements["{Revision}"] = rev_param.AsString() if rev_param else ""
-            except:
-                replacements["{Revision}"] = ""
+            sheet = item.Sheet
+            for name, built_in_param in _SHEET_BUILTIN_PLACEHOLDERS:
+                if name in active:
+                    replacements[name] = _param_as_string(sheet, built_in_param)
 
+        # Add view-specific parameters explicitly
+        elif hasattr(item, 'View'):
             try:
-                rev_date_param = item.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_CURRENT_REVISION_DATE)
-                replacements["{RevisionDate}"] = rev_date_param.AsString() if rev_date_param else ""
+                replacements["ViewType"] = item.ViewType
+                replacements["Scale"] = item.Scale if hasattr(item, 'Scale') else ""
             except:
-                replacements["{RevisionDate}"] = ""
+                pass
 
-            try:
-                rev_desc_param = item.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_CURRENT_REVISION_DESCRIPTION)
-                replacements["{RevisionDescription}"] = rev_desc_param.AsString() if rev_desc_param else ""
-            except:
-                replacements["{RevisionDescription}"] = ""
+            if "Phase" in active:
+                try:
+                    phase_param = element.get_Parameter(DB.BuiltInParameter.VIEW_PHASE)
+                    if phase_param:
+                        phase_id = phase_param.AsElementId()
+                        if phase_id and phase_id.IntegerValue > 0:
+                            phase = self.doc.GetElement(phase_id)
+                            replacements["Phase"] = phase.Name if phase else ""
+                except:
+                    replacements["Phase"] = ""
 
-            try:
-                drawn_param = item.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_DRAWN_BY)
-                replacements["{DrawnBy}"] = drawn_param.AsString() if drawn_param else ""
-            except:
-                replacements["{DrawnBy}"] = ""
+            if "Level" in active:
+                try:
+                    level_param = element.get_Parameter(DB.BuiltInParameter.VIEW_LEVEL)
+                    if level_param:
+                        level_id = level_param.AsElementId()
+                        if level_id and level_id.IntegerValue > 0:
+                            level = self.doc.GetElement(level_id)
+                            replacements["Level"] = level.Name if level else ""
+                except:
+                    replacements["Level"] = ""
 
-            try:
-                checked_param = item.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_CHECKED_BY)
-                replacements["{CheckedBy}"] = checked_param.AsString() if checked_param else ""
-            except:
-                replacements["{CheckedBy}"] = ""
+        # Replace all placeholders in one pass; unknown placeholders are left as typed
+        def _substitute(match):
+            name = match.group(1)
+            if name not in replacements:
+                return match.group(0)
+            return str(replacements[name])
+
+        filename = _PLACEHOLDER_RE.sub(_substitute, pattern)
+
+        # Remove invalid characters
+        return _INVALID_FILENAME_RE.sub('_', filename)
+
+    # Number of item updates batched into one preview ListView refresh during export
+    PROGRESS_REFRESH_INTERVAL = 25
+    # Number of exported items between repaints of the window during export
+    PROGRESS_RENDER_INTERVAL = 5
+
+    def update_export_item_progress(self, sheet_number, format_name, progress, status=""):
+        """Update progress for a specific export item.
 
+        Items.Refresh() regenerates every row of the preview list, so during an export
+        refreshes are batched every PROGRESS_REFRESH_INTERVAL updates; callers flush
+        the remainder with flush_export_item_progress() when a format finishes.
+        """
+        try:
+            if self._set_export_item(sheet_number, format_name, progress, status):
+                if self._pending_progress_updates >= self.PROGRESS_REFRESH_INTERVAL:
+                    self.flush_export_item_progress()
+        except:
+            pass
+
+    def _set_export_item(self, sheet_number, format_name, progress, status=""):
+        """Set an export row's progress/status without refreshing the preview list.
+
+        Returns True if a matching row was found; the change is shown on the next
+        flush_export_item_progress().
+        """
+        for item in self.export_items:
+            if item.SheetNumber == sheet_number and item.Format == format_name:
+                item.Progress = progress
+                if status:
+                    item.Status = status
+                elif progress == 100:
+                    item.Status = "Successfully Completed"
+                self._pending_progress_updates += 1
+                return True
+        return False
+
+    def flush_export_item_progress(self):
+        """Refresh the preview ListView if any progress updates are pending."""
+        if self._pending_progress_updates:
+            self._pending_progress_updates = 0
             try:
-                approved_param = item.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_APPROVED_BY)
-                replacements["{ApprovedBy}"] = approved_param.AsString() if approved_param else ""
-            except:
-                replacements["{ApprovedBy}"] = ""
+                self.export_preview_list.Items.Refresh()
+            except Exception as ex:
+                logger.debug("Error refreshing export preview: {}".format(ex))
+
+    def _show_export_item(self, text):
+        """Show the item about to be exported, painting the window every few items.
+
+        Called right before each per-item Export so the text and bar move while a
+        format runs; painting only every PROGRESS_RENDER_INTERVAL items keeps the
+        layout/render cost off most iterations. Preview rows are refreshed separately,
+        on the PROGRESS_REFRESH_INTERVAL cadence of update_export_item_progress.
+        """
+        self.progress_text.Text = text
+        if self._items_since_render % self.PROGRESS_RENDER_INTERVAL == 0:
+            self._render_pending_ui()
+        self._items_since_render += 1
+
+    def _render_pending_ui(self):
+        """Let WPF lay out and paint queued changes while an export blocks the UI thread.
+
+        Exports have to run on this (Revit's API) thread, so nothing repaints until
+        start_export returns. Invoking a no-op at Render priority drains only work at
+        Render priority or above: progress text, bar and preview rows get painted, but
+        Input is not processed, so no clicks can re-enter the window mid-export.
+        """
+        try:
+            self.Dispatcher.Invoke(DispatcherPriority.Render, Action(lambda: None))
+        except Exception as ex:
+            logger.debug("Error rendering export progress: {}".format(ex))
+
+    def _verify_exported_files(self, output_folder, exported, format_name):
+        """Count exported files that exist on disk.
 
+        The exporters mark each preview row done as soon as its Export call returns;
+        this only produces the final count and flags rows whose file is missing.
+        Uses one directory listing for the whole batch instead of an os.path.exists
+        stat per item (slow on network shares). Names are compared case-insensitively
+        like the Windows file system.
+
+        Args:
+            output_folder: Folder the files were exported to
+            exported: List of (item, expected file name with extension) tuples
+            format_name: Format label used in the export preview (e.g. "DWG")
+
+        Returns:
+            Number of expected files found in output_folder
+        """
+        if not exported:
+            return 0
+        try:
+            on_disk = set(name.lower() for name in os.listdir(output_folder))
+        except OSError as ex:
+            logger.error("Could not list {}: {}".format(output_folder, ex))
+            return 0
+
+        exported_count = 0
+        for item, expected_name in exported:
+            if expected_name.lower() in on_disk:
+                exported_count += 1
+            else:
+                self._set_export_item(item.SheetNumber, format_name, 0, "File not found")
+        return exported_count
+
+    def _get_export_options(self, format_name, builder):
+        """Return this session's options for format_name, building them on first use.
+
+        Called from inside each exporter's try, so a format whose options can't be
+        built fails on its own and the other formats still export. The result is
+        kept until start_export clears it, so UI settings are read once per session.
+        """
+        options = self._export_options.get(format_name)
+        if options is None:
+            options = builder()
+            self._export_options[format_name] = options
+        return options
+
+    def _build_dwg_options(self):
+        """Build DWGExportOptions from the DWG/CAD settings panel."""
+        # Get selected export setup (if any)
+        selected_setup = None
+        selected_setup_name = None
+        if self.cad_export_setup.SelectedIndex > 0:
+            # User selected a specific setup (not the default)
+            selected_item = self.cad_export_setup.SelectedItem
+            if hasattr(selected_item, 'Tag') and selected_item.Tag:
+                selected_setup = selected_item.Tag
+                selected_setup_name = selected_item.Content
+
+        # Create DWG export options
+        dwg_options = DWGExportOptions()
+
+        # Set AutoCAD version
+        dwg_version_index = self.dwg_version.SelectedIndex
+        if dwg_version_index == 0:
+            dwg_options.FileVersion = ACADVersion.R2013
+        elif dwg_version_index == 1:
+            dwg_options.FileVersion = ACADVersion.R2010
+        else:
+            dwg_options.FileVersion = ACADVersion.R2007
+
+        # VERSION-AWARE: Apply CAD export options
+        # ExportingAreas availability varies by version
+        export_views_on_sheets = self.cad_export_views_on_sheets.IsChecked
+        try:
+            if hasattr(dwg_options, 'ExportingAreas') and hasattr(DB, 'ExportingAreas'):
+                if export_views_on_sheets:
+                    dwg_options.ExportingAreas = DB.ExportingAreas.ExportViewsOnSheets
+                else:
+                    dwg_options.ExportingAreas = DB.ExportingAreas.DontExportViewsOnSheets
+        except Exception as ex:
+            logger.debug("ExportingAreas not supported in Revit {}: {}".format(REVIT_VERSION, ex))
+
+        # Export links as external references
+        export_links_as_external = self.cad_export_links_as_external.IsChecked
+        try:
+            if hasattr(dwg_options, 'MergedViews'):
+                dwg_options.MergedViews = not export_links_as_external
+        except Exception as ex:
+            logger.debug("MergedViews not supported in Revit {}: {}".format(REVIT_VERSION, ex))
+
+        # VERSION-AWARE: Handle export setup application
+        # Load settings from selected ExportDWGSettings
+        if selected_setup:
             try:
-                issue_date_param = item.Sheet.get_Parameter(DB.BuiltInParameter.SHEET_ISSUE_DATE)
-                replacements["{IssueDate}"] = issue_date_param.AsString() if issue_date_param else ""
-            except:
-                replacements["{IssueDate}"] = ""
+                # Load all settings from the ExportDWGSettings object
+                # LoadSettingsFrom copies all settings including layers, colors, line weights, etc.
+                dwg_options.LoadSettingsFrom(selected_setup, True)
+            except Exception as setup_ex:
+                logger.warning("Could not apply export setup '{}': {}".format(
+                    selected_setup_name, setup_ex))
+                # Fallback: Set PropOverrides to ByEntity to match Revit colors
+                try:
+                    dwg_options.PropOverrides = PropOverrideMode.ByEntity
+                except:
+                    pass
+        else:
+            # No setup selected - ensure colors match Revit by using ByEntity mode
+            try:
+                dwg_options.PropOverrides = PropOverrideMode.ByEntity
+            except Exception as prop_ex:
+                logger.debug("Could not set PropOverrides: {}".format(prop_ex))
 
-        # Add view-specific parameters explicitly
-        elif hasattr(item, 'View'):
+        return dwg_options
+
+    def _build_pdf_options(self):
+        """Build PDFExportOptions from the PDF settings panel.
+
+        Combine is always True, even for single sheets, to force Revit to use our
+        FileName - with Combine = False Revit ignores it and uses sheet number/name.
+        Callers set FileName before each export.
+        """
+        pdf_options = PDFExportOptions()
+        pdf_options.Combine = True
+
+        # VERSION-AWARE: Apply PDF settings
+        # Use Smart API Adapter if available for intelligent configuration
+        if self.api_adapter:
+            pdf_options = self.api_adapter.configure_pdf_options(
+                pdf_options,
+                hide_scope_boxes=self.pdf_hide_ref_planes.IsChecked,
+                hide_crop_boundaries=self.pdf_hide_crop_boundaries.IsChecked,
+                hide_unreferenced_tags=self.pdf_hide_unreferenced_tags.IsChecked
+            )
+        else:
+            # Fallback to manual configuration
             try:
-                replacements["{ViewType}"] = item.ViewType
-                replacements["{Scale}"] = item.Scale if hasattr(item, 'Scale') else ""
+                if self.pdf_hide_ref_planes.IsChecked:
+                    pdf_options.HideScopeBoxes = True
             except:
-                pass
+                logger.debug("HideScopeBoxes not supported in Revit {}".format(REVIT_VERSION))
 
             try:
-                phase_param = element.get_Parameter(DB.BuiltInParameter.VIEW_PHASE)
-                if phase_param:
-                    phase_id = phase_param.AsElementId()
-                    if phase_id and phase_id.IntegerValue > 0:
-                        phase = self.doc.GetElement(phase_id)
-                        replacements["{Phase}"] = phase.Name if phase else ""
+                if self.pdf_hide_crop_boundaries.IsChecked:
+                    pdf_options.HideCropBoundaries = True
             except:
-                replacements["{Phase}"] = ""
+                logger.debug("HideCropBoundaries not supported in Revit {}".format(REVIT_VERSION))
 
             try:
-                level_param = element.get_Parameter(DB.BuiltInParameter.VIEW_LEVEL)
-                if level_param:
-                    level_id = level_param.AsElementId()
-                    if level_id and level_id.IntegerValue > 0:
-                        level = self.doc.GetElement(level_id)
-                        replacements["{Level}"] = level.Name if level else ""
+                if self.pdf_hide_unreferenced_tags.IsChecked:
+                    pdf_options.HideUnreferencedViewTags = True
             except:
-                replacements["{Level}"] = ""
+                logger.debug("HideUnreferencedViewTags not supported in Revit {}".format(REVIT_VERSION))
 
-        # Replace all placeholders in the pattern
-        filename = pattern
-        for placeholder, value in replacements.items():
-            filename = filename.replace(placeholder, str(value))
+        return pdf_options
 
-        # Remove invalid characters
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
+    def _build_dwf_options(self):
+        """Build DWFExportOptions (Revit defaults)."""
+        return DWFExportOptions()
 
-        return filename
+    def _build_dgn_options(self):
+        """Build DGNExportOptions (Revit defaults)."""
+        return DGNExportOptions()
 
-    def update_export_item_progress(self, sheet_number, format_name, progress, status=""):
-        """Update progress for a specific export item and refresh the display."""
-        try:
-            for item in self.export_items:
-                if item.SheetNumber == sheet_number and item.Format == format_name:
-                    item.Progress = progress
-                    if status:
-                        item.Status = status
-                    elif progress == 100:
-                        item.Status = "Successfully Completed"
-                    # Refresh the ListView to show updated progress
-                    self.export_preview_list.Items.Refresh()
-                    break
+    def _build_nwc_options(self):
+        """Build NavisworksExportOptions scoped to a single view; callers set ViewId."""
+        nwd_options = NavisworksExportOptions()
+        nwd_options.ExportScope = DB.NavisworksExportScope.View
+        return nwd_options
+
+    def _build_ifc_options(self):
+        """Build IFCExportOptions with the IFC version selected in the UI."""
+        ifc_options = IFCExportOptions()
+        ifc_ver_map = {0: IFCVersion.IFC2x2, 1: IFCVersion.IFC2x3, 2: IFCVersion.IFC4}
+        ifc_ver_index = self.ifc_version.SelectedIndex if hasattr(self, 'ifc_version') else 1
+        ifc_options.FileVersion = ifc_ver_map.get(ifc_ver_index, IFCVersion.IFC2x3)
+        ifc_options.WallAndColumnSplitting = True
+        return ifc_options
+
+    def _build_image_options(self):
+        """Build ImageExportOptions from the image settings panel.
+
+        Callers set FilePath and the view list before each ExportImage.
+        """
+        use_fit_to_page = not (hasattr(self, 'img_zoom_to') and self.img_zoom_to.IsChecked)
+        fit_pixels = 1080
+        zoom_percent = 50
+        try:
+            if hasattr(self, 'img_fit_pixels'):
+                fit_pixels = int(self.img_fit_pixels.Text)
         except:
             pass
+        try:
+            if hasattr(self, 'img_zoom_percent'):
+                zoom_percent = int(self.img_zoom_percent.Text)
+        except:
+            pass
+        use_horizontal = not (hasattr(self, 'img_dir_vertical') and self.img_dir_vertical.IsChecked)
+        dpi_map = {
+            0: ImageResolution.DPI_72,
+            1: ImageResolution.DPI_96,
+            2: ImageResolution.DPI_150,
+            3: ImageResolution.DPI_300,
+            4: ImageResolution.DPI_600,
+        }
+        dpi_index = self.img_dpi.SelectedIndex if hasattr(self, 'img_dpi') else 2
+        img_resolution = dpi_map.get(dpi_index, ImageResolution.DPI_150)
+        shaded_idx = self.img_shaded_format.SelectedIndex if hasattr(self, 'img_shaded_format') else 0
+        nonshaded_idx = self.img_nonshaded_format.SelectedIndex if hasattr(self, 'img_nonshaded_format') else 0
+        shaded_fmt = ImageFileType.JPEGLossless if shaded_idx == 1 else ImageFileType.PNG
+        nonshaded_fmt = ImageFileType.JPEGLossless if nonshaded_idx == 1 else ImageFileType.PNG
+
+        img_options = ImageExportOptions()
+        if use_fit_to_page:
+            img_options.ZoomType = DB.ZoomFitType.FitToPage
+            img_options.PixelSize = fit_pixels
+            img_options.FitDirection = DB.FitDirectionType.Horizontal if use_horizontal else DB.FitDirectionType.Vertical
+        else:
+            img_options.ZoomType = DB.ZoomFitType.Zoom
+            img_options.Zoom = zoom_percent
+        img_options.ImageResolution = img_resolution
+        img_options.HLRandWFViewsFileType = nonshaded_fmt
+        img_options.ShadowViewsFileType = shaded_fmt
+        img_options.ExportRange = DB.ExportRange.SetOfViews
+        return img_options
 
     def start_export(self):
         """Start the export process."""
@@ -2499,6 +2869,18 @@ class ExportManagerWindow(forms.WPFWindow):
                     return
                 item_type_name = "views"
 
+            # Placeholder sheets have no views to export; drop them once here instead of
+            # letting every exporter hit an Export error per placeholder
+            if self.selection_mode == "sheets":
+                placeholders = [s for s in selected_items if s.Sheet.IsPlaceholder]
+                if placeholders:
+                    logger.warning("Skipping {} placeholder sheet(s)".format(len(placeholders)))
+                    selected_items = [s for s in selected_items if not s.Sheet.IsPlaceholder]
+                if not selected_items:
+                    forms.alert("The selected sheets are placeholders and can't be exported.",
+                                title="No Exportable Sheets")
+                    return
+
             # Check if reverse order is enabled
             if self.reverse_order.IsChecked:
                 selected_items.reverse()
@@ -2510,8 +2892,7 @@ class ExportManagerWindow(forms.WPFWindow):
                 return
 
             # Create output folder if it doesn't exist
-            if not os.path.exists(output_folder):
-                os.makedirs(output_folder)
+            _ensure_folder(output_folder)
 
             # Check if split by format
             split_by_format = self.save_split_by_format.IsChecked
@@ -2520,95 +2901,50 @@ class ExportManagerWindow(forms.WPFWindow):
             self.next_button.IsEnabled = False
             self.back_button.IsEnabled = False
             self.status_text.Text = "Exporting..."
+            self._begin_naming_session()
+            self._export_options = {}
 
             # Export to each format
+            # NOTE: formats run one after another on purpose. Document.Export/ExportImage
+            # may only be called from Revit's API thread (this modal window's thread);
+            # dispatching them to Task/thread-pool workers throws or corrupts the session.
             total_exported = 0
             total_items = len(self.export_items)
             current_item = 0
 
-            if self.export_dwg.IsChecked:
-                folder = os.path.join(output_folder, "DWG") if split_by_format else output_folder
-                if not os.path.exists(folder):
-                    os.makedirs(folder)
-                count = self.export_to_dwg(selected_items, folder)
-                total_exported += count
-                current_item += count
-                if total_items > 0:
-                    progress_percent = int((current_item * 100.0) / total_items)
-                    self.overall_progress.Value = progress_percent
-                    self.progress_text.Text = "Completed {}%".format(progress_percent)
-
-            if self.export_pdf.IsChecked:
-                folder = os.path.join(output_folder, "PDF") if split_by_format else output_folder
-                if not os.path.exists(folder):
-                    os.makedirs(folder)
-                count = self.export_to_pdf(selected_items, folder)
-                total_exported += count
-                current_item += count
-                if total_items > 0:
-                    progress_percent = int((current_item * 100.0) / total_items)
-                    self.overall_progress.Value = progress_percent
-                    self.progress_text.Text = "Completed {}%".format(progress_percent)
-
-            if self.export_dwf.IsChecked:
-                folder = os.path.join(output_folder, "DWF") if split_by_format else output_folder
-                if not os.path.exists(folder):
-                    os.makedirs(folder)
-                count = self.export_to_dwf(selected_items, folder)
-                total_exported += count
-                current_item += count
-                if total_items > 0:
-                    progress_percent = int((current_item * 100.0) / total_items)
-                    self.overall_progress.Value = progress_percent
-                    self.progress_text.Text = "Completed {}%".format(progress_percent)
-
-            if self.export_dgn.IsChecked:
-                folder = os.path.join(output_folder, "DGN") if split_by_format else output_folder
-                if not os.path.exists(folder):
-                    os.makedirs(folder)
-                count = self.export_to_dgn(selected_items, folder)
-                total_exported += count
-                current_item += count
-                if total_items > 0:
-                    progress_percent = int((current_item * 100.0) / total_items)
-                    self.overall_progress.Value = progress_percent
-                    self.progress_text.Text = "Completed {}%".format(progress_percent)
-
-            if self.export_nwd.IsChecked:
-                folder = os.path.join(output_folder, "NWC") if split_by_format else output_folder
-                if not os.path.exists(folder):
-                    os.makedirs(folder)
-                count = self.export_to_nwd(selected_items, folder)
-                total_exported += count
-                current_item += count
-                if total_items > 0:
-                    progress_percent = int((current_item * 100.0) / total_items)
-                    self.overall_progress.Value = progress_percent
-                    self.progress_text.Text = "Completed {}%".format(progress_percent)
-
-            if self.export_ifc.IsChecked:
-                folder = os.path.join(output_folder, "IFC") if split_by_format else output_folder
-                if not os.path.exists(folder):
-                    os.makedirs(folder)
-                count = self.export_to_ifc(selected_items, folder)
-                total_exported += count
-                current_item += count
-                if total_items > 0:
-                    progress_percent = int((current_item * 100.0) / total_items)
-                    self.overall_progress.Value = progress_percent
-                    self.progress_text.Text = "Completed {}%".format(progress_percent)
+            # (subfolder when split by format, enabled checkbox, exporter)
+            formats = [
+                ("DWG", self.export_dwg, self.export_to_dwg),
+                ("PDF", self.export_pdf, self.export_to_pdf),
+                ("DWF", self.export_dwf, self.export_to_dwf),
+                ("DGN", self.export_dgn, self.export_to_dgn),
+                ("NWC", self.export_nwd, self.export_to_nwd),
+                ("IFC", self.export_ifc, self.export_to_ifc),
+                ("Images", self.export_img, self.export_to_images),
+            ]
 
-            if self.export_img.IsChecked:
-                folder = os.path.join(output_folder, "Images") if split_by_format else output_folder
-                if not os.path.exists(folder):
-                    os.makedirs(folder)
-                count = self.export_to_images(selected_items, folder)
+            # First pass: resolve and create the target folder of every enabled format
+            enabled_formats = []
+            for subfolder, checkbox, exporter in formats:
+                if not checkbox.IsChecked:
+                    continue
+                folder = os.path.join(output_folder, subfolder) if split_by_format else output_folder
+                if folder != output_folder:
+                    _ensure_folder(folder)
+                enabled_formats.append((folder, exporter))
+
+            # Second pass: run the exporters
+            self._items_since_render = 0
+            for folder, exporter in enabled_formats:
+                count = exporter(selected_items, folder)
+                self.flush_export_item_progress()
                 total_exported += count
                 current_item += count
                 if total_items > 0:
                     progress_percent = int((current_item * 100.0) / total_items)
                     self.overall_progress.Value = progress_percent
                     self.progress_text.Text = "Completed {}%".format(progress_percent)
+                self._render_pending_ui()
 
             self.status_text.Text = "Export complete! {} files exported".format(total_exported)
             self.progress_text.Text = "Export complete! {} files exported".format(total_exported)
@@ -2628,6 +2964,11 @@ class ExportManagerWindow(forms.WPFWindow):
             self.status_text.Text = "Export failed"
             self.next_button.IsEnabled = True
             self.back_button.IsEnabled = True
+        finally:
+            # Options and names reflect the UI at export time; rebuild them next session
+            self._export_options = {}
+            self._resolved_names = {}
+            self._synced_items = set()
 
     def export_to_dwg(self, items, output_folder):
         """Export items (sheets or views) to DWG format with version-aware API usage.
@@ -2636,105 +2977,36 @@ class ExportManagerWindow(forms.WPFWindow):
         """
         try:
             # Sync cached values with live values from Revit
-            for item in items:
-                if hasattr(item, 'Sheet'):
-                    item.SheetNumber = item.Sheet.SheetNumber
-                    item.SheetName = item.Sheet.Name
-                elif hasattr(item, 'View'):
-                    item.SheetNumber = item.View.Name
-                    item.ViewName = item.View.Name
-
-            # Get selected export setup (if any)
-            selected_setup = None
-            selected_setup_name = None
-            if self.cad_export_setup.SelectedIndex > 0:
-                # User selected a specific setup (not the default)
-                selected_item = self.cad_export_setup.SelectedItem
-                if hasattr(selected_item, 'Tag') and selected_item.Tag:
-                    selected_setup = selected_item.Tag
-                    selected_setup_name = selected_item.Content
-
-            # Create DWG export options
-            dwg_options = DWGExportOptions()
-
-            # Set AutoCAD version
-            dwg_version_index = self.dwg_version.SelectedIndex
-            if dwg_version_index == 0:
-                dwg_options.FileVersion = ACADVersion.R2013
-            elif dwg_version_index == 1:
-                dwg_options.FileVersion = ACADVersion.R2010
-            else:
-                dwg_options.FileVersion = ACADVersion.R2007
+            self._sync_item_names(items)
 
-            # VERSION-AWARE: Apply CAD export options
-            # ExportingAreas availability varies by version
-            export_views_on_sheets = self.cad_export_views_on_sheets.IsChecked
-            try:
-                if hasattr(dwg_options, 'ExportingAreas') and hasattr(DB, 'ExportingAreas'):
-                    if export_views_on_sheets:
-                        dwg_options.ExportingAreas = DB.ExportingAreas.ExportViewsOnSheets
-                    else:
-                        dwg_options.ExportingAreas = DB.ExportingAreas.DontExportViewsOnSheets
-            except Exception as ex:
-                logger.debug("ExportingAreas not supported in Revit {}: {}".format(REVIT_VERSION, ex))
+            # Options are built once per export session (see _get_export_options)
+            dwg_options = self._get_export_options("DWG", self._build_dwg_options)
 
-            # Export links as external references
-            export_links_as_external = self.cad_export_links_as_external.IsChecked
-            try:
-                if hasattr(dwg_options, 'MergedViews'):
-                    dwg_options.MergedViews = not export_links_as_external
-            except Exception as ex:
-                logger.debug("MergedViews not supported in Revit {}: {}".format(REVIT_VERSION, ex))
+            exported = []  # (item, expected file name) for every Export call that didn't raise
 
-            # VERSION-AWARE: Handle export setup application
-            # Load settings from selected ExportDWGSettings
-            if selected_setup:
-                try:
-                    # Load all settings from the ExportDWGSettings object
-                    # LoadSettingsFrom copies all settings including layers, colors, line weights, etc.
-                    dwg_options.LoadSettingsFrom(selected_setup, True)
-                except Exception as setup_ex:
-                    logger.warning("Could not apply export setup '{}': {}".format(
-                        selected_setup_name, setup_ex))
-                    # Fallback: Set PropOverrides to ByEntity to match Revit colors
-                    try:
-                        dwg_options.PropOverrides = PropOverrideMode.ByEntity
-                    except:
-                        pass
-            else:
-                # No setup selected - ensure colors match Revit by using ByEntity mode
-                try:
-                    dwg_options.PropOverrides = PropOverrideMode.ByEntity
-                except Exception as prop_ex:
-                    logger.debug("Could not set PropOverrides: {}".format(prop_ex))
-
-            exported_count = 0
+            # VERSION-AWARE: Export API handling
+            # All versions 2022-2026 support ICollection<ElementId> signature
+            # Signature: Export(String folder, String name, ICollection<ElementId> views, DWGExportOptions options)
+            # One Export call per item (each gets its own file name); the id list is reused.
+            view_ids = ElementIdList()
 
             for item in items:
                 try:
                     # Get the actual element (sheet or view)
                     if hasattr(item, 'Sheet'):
                         element = item.Sheet
-                        element_name = element.SheetNumber
                     elif hasattr(item, 'View'):
                         element = item.View
-                        element_name = element.Name
                     else:
                         continue
+                    element_name = item.SheetNumber  # synced above: sheet number or view name
 
                     # Update progress text to show current item and format
-                    self.progress_text.Text = "Exporting {} to DWG...".format(element_name)
-
-                    filename = item.CustomFilename or self.get_export_filename(item)
+                    self._show_export_item("Exporting {} to DWG...".format(element_name))
 
-                    # Remove extension if present
-                    if filename.lower().endswith('.dwg'):
-                        filename = filename[:-4]
+                    filename = self._get_item_filename(item, '.dwg')
 
-                    # VERSION-AWARE: Export API handling
-                    # All versions 2022-2026 support ICollection<ElementId> signature
-                    # Signature: Export(String folder, String name, ICollection<ElementId> views, DWGExportOptions options)
-                    view_ids = List[DB.ElementId]()
+                    view_ids.Clear()
                     view_ids.Add(element.Id)
 
                     # Use Smart API Adapter if available for intelligent export
@@ -2743,24 +3015,15 @@ class ExportManagerWindow(forms.WPFWindow):
                         self.api_adapter.export_dwg(output_folder, filename, view_ids, dwg_options)
                     else:
                         # Fallback to direct export call
-                        if REVIT_VERSION >= 2022:
-                            # Revit 2022-2026: Use ICollection<ElementId> signature
-                            self.doc.Export(output_folder, filename, view_ids, dwg_options)
-                        else:
-                            # Fallback for older versions (if needed)
-                            self.doc.Export(output_folder, filename, view_ids, dwg_options)
+                        self.doc.Export(output_folder, filename, view_ids, dwg_options)
 
-                    # Verify file was created
-                    expected_file = os.path.join(output_folder, filename + ".dwg")
-                    if os.path.exists(expected_file):
-                        exported_count += 1
-                        # Update progress for this export item
-                        self.update_export_item_progress(item.SheetNumber, "DWG", 100)
+                    exported.append((item, filename + ".dwg"))
+                    self.update_export_item_progress(item.SheetNumber, "DWG", 100)
 
                 except Exception as ex:
                     logger.error("Error exporting {} to DWG: {}".format(element_name, ex))
 
-            return exported_count
+            return self._verify_exported_files(output_folder, exported, "DWG")
 
         except Exception as ex:
             logger.error("DWG export failed: {}".format(ex))
@@ -2769,49 +3032,39 @@ class ExportManagerWindow(forms.WPFWindow):
     def export_to_dgn(self, items, output_folder):
         """Export items (sheets or views) to DGN (MicroStation) format."""
         try:
-            for item in items:
-                if hasattr(item, 'Sheet'):
-                    item.SheetNumber = item.Sheet.SheetNumber
-                    item.SheetName = item.Sheet.Name
-                elif hasattr(item, 'View'):
-                    item.SheetNumber = item.View.Name
-                    item.ViewName = item.View.Name
+            # Sync cached values with live values from Revit
+            self._sync_item_names(items)
 
-            dgn_options = DGNExportOptions()
+            dgn_options = self._get_export_options("DGN", self._build_dgn_options)
+            view_ids = ElementIdList()
 
-            exported_count = 0
+            exported = []  # (item, expected file name) for every Export call that didn't raise
 
             for item in items:
                 try:
                     if hasattr(item, 'Sheet'):
                         element = item.Sheet
-                        element_name = element.SheetNumber
                     elif hasattr(item, 'View'):
                         element = item.View
-                        element_name = element.Name
                     else:
                         continue
+                    element_name = item.SheetNumber  # synced above: sheet number or view name
 
-                    self.progress_text.Text = "Exporting {} to DGN...".format(element_name)
+                    self._show_export_item("Exporting {} to DGN...".format(element_name))
 
-                    filename = item.CustomFilename or self.get_export_filename(item)
-                    if filename.lower().endswith('.dgn'):
-                        filename = filename[:-4]
+                    filename = self._get_item_filename(item, '.dgn')
 
-                    view_ids = List[DB.ElementId]()
+                    view_ids.Clear()
                     view_ids.Add(element.Id)
 
                     self.doc.Export(output_folder, filename, view_ids, dgn_options)
-
-                    expected_file = os.path.join(output_folder, filename + ".dgn")
-                    if os.path.exists(expected_file):
-                        exported_count += 1
-                        self.update_export_item_progress(item.SheetNumber, "DGN", 100)
+                    exported.append((item, filename + ".dgn"))
+                    self.update_export_item_progress(item.SheetNumber, "DGN", 100)
 
                 except Exception as ex:
                     logger.error("Error exporting {} to DGN: {}".format(element_name, ex))
 
-            return exported_count
+            return self._verify_exported_files(output_folder, exported, "DGN")
 
         except Exception as ex:
             logger.error("DGN export failed: {}".format(ex))
@@ -2821,19 +3074,16 @@ class ExportManagerWindow(forms.WPFWindow):
         """Export items (sheets or views) to PDF format using Revit's native PDF export with version-aware API usage.
 
         Supports Revit 2022-2026 with appropriate API handling for each version.
+
+        Exports run one after another on Revit's API thread: Document.Export is not
+        thread-safe and returns only once the file is written, so no worker pool
+        and no wait after each call.
         """
         try:
-            import time
             import glob
 
             # Sync cached values with live values from Revit
-            for item in items:
-                if hasattr(item, 'Sheet'):
-                    item.SheetNumber = item.Sheet.SheetNumber
-                    item.SheetName = item.Sheet.Name
-                elif hasattr(item, 'View'):
-                    item.SheetNumber = item.View.Name
-                    item.ViewName = item.View.Name
+            self._sync_item_names(items)
 
             # Check if combine PDF is enabled
             combine_pdf = self.combine_pdf.IsChecked
@@ -2845,6 +3095,7 @@ class ExportManagerWindow(forms.WPFWindow):
                 try:
                     # Update progress text
                     self.progress_text.Text = "Exporting combined PDF with {} items...".format(len(items))
+                    self._render_pending_ui()
 
                     # Generate combined filename using live names
                     if len(items) > 0:
@@ -2861,56 +3112,23 @@ class ExportManagerWindow(forms.WPFWindow):
                     else:
                         filename = "Combined_Export"
 
-                    # Remove extension if present
-                    if filename.lower().endswith('.pdf'):
-                        filename = filename[:-4]
-
                     # Get list of existing PDF files before export
-                    existing_pdfs = set(glob.glob(os.path.join(output_folder, "*.pdf")))
+                    pdf_pattern = os.path.join(output_folder, "*.pdf")
+                    existing_pdfs = set(glob.glob(pdf_pattern))
 
                     # Get all element IDs as System.Collections.Generic.List
-                    element_ids = List[DB.ElementId]()
+                    element_ids = ElementIdList()
                     for item in items:
                         if hasattr(item, 'Sheet'):
                             element_ids.Add(item.Sheet.Id)
                         elif hasattr(item, 'View'):
                             element_ids.Add(item.View.Id)
 
-                    # Create PDF export options
-                    pdf_options = PDFExportOptions()
-                    pdf_options.Combine = True
+                    # Session PDF options; only the file name differs per export
+                    pdf_options = self._get_export_options("PDF", self._build_pdf_options)
                     # Set filename (learned from pyRevit)
                     pdf_options.FileName = filename
 
-                    # VERSION-AWARE: Apply PDF settings
-                    # Use Smart API Adapter if available for intelligent configuration
-                    if self.api_adapter:
-                        pdf_options = self.api_adapter.configure_pdf_options(
-                            pdf_options,
-                            hide_scope_boxes=self.pdf_hide_ref_planes.IsChecked,
-                            hide_crop_boundaries=self.pdf_hide_crop_boundaries.IsChecked,
-                            hide_unreferenced_tags=self.pdf_hide_unreferenced_tags.IsChecked
-                        )
-                    else:
-                        # Fallback to manual configuration
-                        try:
-                            if self.pdf_hide_ref_planes.IsChecked:
-                                pdf_options.HideScopeBoxes = True
-                        except:
-                            logger.debug("HideScopeBoxes not supported in Revit {}".format(REVIT_VERSION))
-
-                        try:
-                            if self.pdf_hide_crop_boundaries.IsChecked:
-                                pdf_options.HideCropBoundaries = True
-                        except:
-                            logger.debug("HideCropBoundaries not supported in Revit {}".format(REVIT_VERSION))
-
-                        try:
-                            if self.pdf_hide_unreferenced_tags.IsChecked:
-                                pdf_options.HideUnreferencedViewTags = True
-                        except:
-                            logger.debug("HideUnreferencedViewTags not supported in Revit {}".format(REVIT_VERSION))
-
                     # VERSION-AWARE: Export using Revit's native PDF export
                     # Use Smart API Adapter if available for intelligent export (handles method overload resolution)
                     if self.api_adapter:
@@ -2923,16 +3141,13 @@ class ExportManagerWindow(forms.WPFWindow):
                         # Instead, filename is set via PDFExportOptions.FileName property (learned from pyRevit)
                         self.doc.Export(output_folder, element_ids, pdf_options)
 
-                    # Wait briefly for file system to update
-                    time.sleep(0.5)
-
                     # Get list of PDF files after export
-                    current_pdfs = set(glob.glob(os.path.join(output_folder, "*.pdf")))
+                    current_pdfs = set(glob.glob(pdf_pattern))
                     new_pdfs = current_pdfs - existing_pdfs
 
-                    # Verify file was created
+                    # Verify file was created - the listing above already holds it, no extra stat
                     expected_file = os.path.join(output_folder, filename + ".pdf")
-                    if os.path.exists(expected_file) or new_pdfs:
+                    if new_pdfs or expected_file in current_pdfs:
                         exported_count = 1
                         # Update progress for all items in combined PDF
                         for item in items:
@@ -2942,70 +3157,38 @@ class ExportManagerWindow(forms.WPFWindow):
                     logger.error("Error exporting combined PDF: {}".format(ex))
 
             else:
-                # Export each item individually
+                # Session PDF options (Combine = True, see _build_pdf_options);
+                # only FileName and the id list change per item
+                pdf_options = self._get_export_options("PDF", self._build_pdf_options)
+                element_ids = ElementIdList()
+                exported = []  # (item, expected file name) for every Export call that didn't raise
+
+                # Export each item individually.
+                # A single Export with Combine = False would let Revit name the files via
+                # PDFExportOptions.SetNamingRule, but a naming rule can only concatenate
+                # element parameters: it can't reproduce per-item CustomFilename overrides,
+                # project info/date tokens or our filename sanitising, so we keep one
+                # Export per item with Combine = True and an explicit FileName.
                 for item in items:
                     try:
                         # Get the actual element (sheet or view)
                         if hasattr(item, 'Sheet'):
                             element = item.Sheet
-                            element_name = element.SheetNumber
                         elif hasattr(item, 'View'):
                             element = item.View
-                            element_name = element.Name
                         else:
                             continue
+                        element_name = item.SheetNumber  # synced above: sheet number or view name
 
                         # Update progress text to show current item and format
-                        self.progress_text.Text = "Exporting {} to PDF...".format(element_name)
+                        self._show_export_item("Exporting {} to PDF...".format(element_name))
 
-                        filename = item.CustomFilename or self.get_export_filename(item)
+                        filename = self._get_item_filename(item, '.pdf')
 
-                        # Remove extension if present
-                        if filename.lower().endswith('.pdf'):
-                            filename = filename[:-4]
-
-                        # Get list of existing PDF files before export
-                        existing_pdfs = set(glob.glob(os.path.join(output_folder, "*.pdf")))
-
-                        # Create PDF export options
-                        pdf_options = PDFExportOptions()
-                        # IMPORTANT: Use Combine = True even for single sheets to force Revit to use our filename
-                        # When Combine = False, Revit ignores FileName and uses sheet number/name
-                        pdf_options.Combine = True
                         # Set filename to match DWG naming pattern
                         pdf_options.FileName = filename
 
-                        # VERSION-AWARE: Apply PDF settings
-                        # Use Smart API Adapter if available for intelligent configuration
-                        if self.api_adapter:
-                            pdf_options = self.api_adapter.configure_pdf_options(
-                                pdf_options,
-                                hide_scope_boxes=self.pdf_hide_ref_planes.IsChecked,
-                                hide_crop_boundaries=self.pdf_hide_crop_boundaries.IsChecked,
-                                hide_unreferenced_tags=self.pdf_hide_unreferenced_tags.IsChecked
-                            )
-                        else:
-                            # Fallback to manual configuration
-                            try:
-                                if self.pdf_hide_ref_planes.IsChecked:
-                                    pdf_options.HideScopeBoxes = True
-                            except:
-                                logger.debug("HideScopeBoxes not supported in Revit {}".format(REVIT_VERSION))
-
-                            try:
-                                if self.pdf_hide_crop_boundaries.IsChecked:
-                                    pdf_options.HideCropBoundaries = True
-                            except:
-                                logger.debug("HideCropBoundaries not supported in Revit {}".format(REVIT_VERSION))
-
-                            try:
-                                if self.pdf_hide_unreferenced_tags.IsChecked:
-                                    pdf_options.HideUnreferencedViewTags = True
-                            except:
-                                logger.debug("HideUnreferencedViewTags not supported in Revit {}".format(REVIT_VERSION))
-
-                        # Create System.Collections.Generic.List for element IDs
-                        element_ids = List[DB.ElementId]()
+                        element_ids.Clear()
                         element_ids.Add(element.Id)
 
                         # VERSION-AWARE: Export using Revit's native PDF export
@@ -3020,23 +3203,14 @@ class ExportManagerWindow(forms.WPFWindow):
                             # Instead, filename is set via PDFExportOptions.FileName property (learned from pyRevit)
                             self.doc.Export(output_folder, element_ids, pdf_options)
 
-                        # Wait briefly for file system to update
-                        time.sleep(0.3)
-
-                        # Get list of PDF files after export
-                        current_pdfs = set(glob.glob(os.path.join(output_folder, "*.pdf")))
-                        new_pdfs = current_pdfs - existing_pdfs
-
-                        # Verify file was created
-                        expected_file = os.path.join(output_folder, filename + ".pdf")
-                        if os.path.exists(expected_file) or new_pdfs:
-                            exported_count += 1
-                            # Update progress for this export item
-                            self.update_export_item_progress(item.SheetNumber, "PDF", 100)
+                        exported.append((item, filename + ".pdf"))
+                        self.update_export_item_progress(item.SheetNumber, "PDF", 100)
 
                     except Exception as ex:
                         logger.error("Error exporting {} to PDF: {}".format(element_name, ex))
 
+                exported_count = self._verify_exported_files(output_folder, exported, "PDF")
+
             return exported_count
 
         except Exception as ex:
@@ -3050,58 +3224,45 @@ class ExportManagerWindow(forms.WPFWindow):
         """
         try:
             # Sync cached values with live values from Revit
-            for item in items:
-                if hasattr(item, 'Sheet'):
-                    item.SheetNumber = item.Sheet.SheetNumber
-                    item.SheetName = item.Sheet.Name
-                elif hasattr(item, 'View'):
-                    item.SheetNumber = item.View.Name
-                    item.ViewName = item.View.Name
+            self._sync_item_names(items)
 
-            # Create DWF export options
-            dwf_options = DWFExportOptions()
+            dwf_options = self._get_export_options("DWF", self._build_dwf_options)
 
-            exported_count = 0
+            exported = []  # (item, expected file name) for every Export call that didn't raise
+
+            # One Export per item on purpose: a multi-view ViewSet either merges everything
+            # into one DWF (MergedViews = True) or lets Revit name each file itself
+            # ("<name>-Sheet - <number> - <title>"), which drops the naming pattern.
+            # Revit 2022-2026 all support the ViewSet signature, so there is no version
+            # branch: Export(String folder, String name, ViewSet views, DWFExportOptions options)
+            view_set = DB.ViewSet()
 
             for item in items:
                 try:
                     # Get the actual element (sheet or view)
                     if hasattr(item, 'Sheet'):
                         element = item.Sheet
-                        element_name = element.SheetNumber
                     elif hasattr(item, 'View'):
                         element = item.View
-                        element_name = element.Name
                     else:
                         continue
+                    element_name = item.SheetNumber  # synced above: sheet number or view name
 
                     # Update progress text to show current item and format
-                    self.progress_text.Text = "Exporting {} to DWF...".format(element_name)
-
-                    filename = item.CustomFilename or self.get_export_filename(item)
+                    self._show_export_item("Exporting {} to DWF...".format(element_name))
 
-                    # Remove extension if present
-                    if filename.lower().endswith('.dwf'):
-                        filename = filename[:-4]
+                    filename = self._get_item_filename(item, '.dwf')
 
-                    # VERSION-AWARE: Export handling
-                    # Revit 2022-2026 all support ViewSet for DWF export
-                    # Signature: Export(String folder, String name, ViewSet views, DWFExportOptions options)
-                    view_set = DB.ViewSet()
+                    view_set.Clear()
                     view_set.Insert(element)
                     self.doc.Export(output_folder, filename, view_set, dwf_options)
-
-                    # Verify file was created
-                    expected_file = os.path.join(output_folder, filename + ".dwf")
-                    if os.path.exists(expected_file):
-                        exported_count += 1
-                        # Update progress for this export item
-                        self.update_export_item_progress(item.SheetNumber, "DWF", 100)
+                    exported.append((item, filename + ".dwf"))
+                    self.update_export_item_progress(item.SheetNumber, "DWF", 100)
 
                 except Exception as ex:
                     logger.error("Error exporting {} to DWF: {}".format(element_name, ex))
 
-            return exported_count
+            return self._verify_exported_files(output_folder, exported, "DWF")
 
         except Exception as ex:
             logger.error("DWF export failed: {}".format(ex))
@@ -3114,16 +3275,9 @@ class ExportManagerWindow(forms.WPFWindow):
 
         try:
             # Sync cached values with live values from Revit
-            for item in items:
-                if hasattr(item, 'Sheet'):
-                    item.SheetNumber = item.Sheet.SheetNumber
-                    item.SheetName = item.Sheet.Name
-                elif hasattr(item, 'View'):
-                    item.SheetNumber = item.View.Name
-                    item.ViewName = item.View.Name
+            self._sync_item_names(items)
 
-            # Create Navisworks export options
-            nwd_options = NavisworksExportOptions()
+            nwd_options = self._get_export_options("NWC", self._build_nwc_options)
 
             exported_count = 0
 
@@ -3132,21 +3286,18 @@ class ExportManagerWindow(forms.WPFWindow):
                     # Get the actual element (sheet or view)
                     if hasattr(item, 'Sheet'):
                         element = item.Sheet
-                        element_name = element.SheetNumber
                     elif hasattr(item, 'View'):
                         element = item.View
-                        element_name = element.Name
                     else:
                         continue
+                    element_name = item.SheetNumber  # synced above: sheet number or view name
 
                     # Update progress text to show current item and format
-                    self.progress_text.Text = "Exporting {} to NWC...".format(element_name)
+                    self._show_export_item("Exporting {} to NWC...".format(element_name))
 
-                    filename = item.CustomFilename or self.get_export_filename(item)
-                    filepath = os.path.join(output_folder, filename + ".nwc")
+                    filename = self._get_item_filename(item, '.nwc')
 
                     # Export view
-                    nwd_options.ExportScope = DB.NavisworksExportScope.View
                     nwd_options.ViewId = element.Id
 
                     self.doc.Export(output_folder, filename, nwd_options)
@@ -3171,20 +3322,9 @@ class ExportManagerWindow(forms.WPFWindow):
 
         try:
             # Sync cached values with live values from Revit
-            for item in items:
-                if hasattr(item, 'Sheet'):
-                    item.SheetNumber = item.Sheet.SheetNumber
-                    item.SheetName = item.Sheet.Name
-                elif hasattr(item, 'View'):
-                    item.SheetNumber = item.View.Name
-                    item.ViewName = item.View.Name
-
-            # Create IFC export options — version read from UI
-            ifc_options = IFCExportOptions()
-            ifc_ver_map = {0: IFCVersion.IFC2x2, 1: IFCVersion.IFC2x3, 2: IFCVersion.IFC4}
-            ifc_ver_index = self.ifc_version.SelectedIndex if hasattr(self, 'ifc_version') else 1
-            ifc_options.FileVersion = ifc_ver_map.get(ifc_ver_index, IFCVersion.IFC2x3)
-            ifc_options.WallAndColumnSplitting = True
+            self._sync_item_names(items)
+
+            ifc_options = self._get_export_options("IFC", self._build_ifc_options)
 
             exported_count = 0
 
@@ -3194,6 +3334,7 @@ class ExportManagerWindow(forms.WPFWindow):
                 try:
                     # Update progress text to show IFC export
                     self.progress_text.Text = "Exporting entire model to IFC..."
+                    self._render_pending_ui()
 
                     # Generate filename using naming pattern similar to combined PDF
                     # Use first and last item for combined exports
@@ -3214,21 +3355,17 @@ class ExportManagerWindow(forms.WPFWindow):
                     else:
                         filename = "Model_IFC_Export"
 
-                    # Remove extension if present
-                    if filename.lower().endswith('.ifc'):
-                        filename = filename[:-4]
-
                     # Clean filename - remove invalid chars and extra spaces
-                    invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-                    for char in invalid_chars:
-                        filename = filename.replace(char, '_')
-                    filename = filename.strip()
+                    filename = _INVALID_FILENAME_RE.sub('_', filename).strip()
 
-                    # IFC export needs to be wrapped in a transaction
+                    # IFC export needs an open transaction (the exporter may touch the
+                    # document), but nothing it changes has to be kept: roll back so no
+                    # undo entry is recorded and the model isn't regenerated on commit.
+                    # The IFC file is already written when Export returns.
                     with Transaction(self.doc, "Export IFC") as trans:
                         trans.Start()
                         self.doc.Export(output_folder, filename, ifc_options)
-                        trans.Commit()
+                        trans.RollBack()
 
                     exported_count = 1
                     # Update progress for all IFC export items
@@ -3244,19 +3381,27 @@ class ExportManagerWindow(forms.WPFWindow):
             return 0
 
     def export_to_images(self, items, output_folder):
-        """Export items (sheets or views) to image format using Revit's native image export with version-aware API usage."""
+        """Export items (sheets or views) to image format using Revit's native image export with version-aware API usage.
+
+        Like export_to_pdf, items are exported one by one on Revit's API thread;
+        ExportImage is synchronous, so the file listing right after it is reliable.
+        """
         try:
-            import time
             import glob
 
             # Sync cached values with live values from Revit
-            for item in items:
-                if hasattr(item, 'Sheet'):
-                    item.SheetNumber = item.Sheet.SheetNumber
-                    item.SheetName = item.Sheet.Name
-                elif hasattr(item, 'View'):
-                    item.SheetNumber = item.View.Name
-                    item.ViewName = item.View.Name
+            self._sync_item_names(items)
+
+            # Options are built once per export session (see _get_export_options); only
+            # FilePath and the view list change per item. Each item is still exported on its
+            # own call because every image is renamed to its own pattern-based filename,
+            # which a single multi-view ExportImage can't produce.
+            img_options = self._get_export_options("IMG", self._build_image_options)
+            view_ids = ElementIdList()
+
+            # Join the constant folder part once; per item only the file name is appended
+            folder_prefix = os.path.join(output_folder, "")
+            png_pattern = folder_prefix + "*.png"
 
             exported_count = 0
 
@@ -3265,112 +3410,62 @@ class ExportManagerWindow(forms.WPFWindow):
                     # Get the actual element (sheet or view)
                     if hasattr(item, 'Sheet'):
                         element = item.Sheet
-                        element_name = element.SheetNumber
                     elif hasattr(item, 'View'):
                         element = item.View
-                        element_name = element.Name
                     else:
                         continue
+                    element_name = item.SheetNumber  # synced above: sheet number or view name
 
                     # Update progress text to show current item and format
-                    self.progress_text.Text = "Exporting {} to Image...".format(element_name)
+                    self._show_export_item("Exporting {} to Image...".format(element_name))
 
-                    filename = item.CustomFilename or self.get_export_filename(item)
-
-                    # Remove extension if present
-                    if filename.lower().endswith('.png'):
-                        filename = filename[:-4]
+                    filename = self._get_item_filename(item, '.png')
 
                     # Clean filename - remove invalid chars and extra spaces
-                    invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-                    for char in invalid_chars:
-                        filename = filename.replace(char, '_')
-                    filename = filename.strip()
+                    filename = _INVALID_FILENAME_RE.sub('_', filename).strip()
 
                     # Get list of existing image files before export
-                    existing_images = set(glob.glob(os.path.join(output_folder, "*.png")))
+                    existing_images = set(glob.glob(png_pattern))
 
-                    # Read image options from UI
-                    use_fit_to_page = not (hasattr(self, 'img_zoom_to') and self.img_zoom_to.IsChecked)
-                    fit_pixels = 1080
-                    zoom_percent = 50
-                    try:
-                        if hasattr(self, 'img_fit_pixels'):
-                            fit_pixels = int(self.img_fit_pixels.Text)
-                    except:
-                        pass
-                    try:
-                        if hasattr(self, 'img_zoom_percent'):
-                            zoom_percent = int(self.img_zoom_percent.Text)
-                    except:
-                        pass
-                    use_horizontal = not (hasattr(self, 'img_dir_vertical') and self.img_dir_vertical.IsChecked)
-                    dpi_map = {
-                        0: ImageResolution.DPI_72,
-                        1: ImageResolution.DPI_96,
-                        2: ImageResolution.DPI_150,
-                        3: ImageResolution.DPI_300,
-                        4: ImageResolution.DPI_600,
-                    }
-                    dpi_index = self.img_dpi.SelectedIndex if hasattr(self, 'img_dpi') else 2
-                    img_resolution = dpi_map.get(dpi_index, ImageResolution.DPI_150)
-                    shaded_idx = self.img_shaded_format.SelectedIndex if hasattr(self, 'img_shaded_format') else 0
-                    nonshaded_idx = self.img_nonshaded_format.SelectedIndex if hasattr(self, 'img_nonshaded_format') else 0
-                    shaded_fmt = ImageFileType.JPEGLossless if shaded_idx == 1 else ImageFileType.PNG
-                    nonshaded_fmt = ImageFileType.JPEGLossless if nonshaded_idx == 1 else ImageFileType.PNG
-
-                    # Create image export options for each sheet
-                    img_options = ImageExportOptions()
-                    if use_fit_to_page:
-                        img_options.ZoomType = DB.ZoomFitType.FitToPage
-                        img_options.PixelSize = fit_pixels
-                        img_options.FitDirection = DB.FitDirectionType.Horizontal if use_horizontal else DB.FitDirectionType.Vertical
-                    else:
-                        img_options.ZoomType = DB.ZoomFitType.Zoom
-                        img_options.Zoom = zoom_percent
-                    img_options.ImageResolution = img_resolution
-                    img_options.FilePath = os.path.join(output_folder, filename)
-                    img_options.HLRandWFViewsFileType = nonshaded_fmt
-                    img_options.ShadowViewsFileType = shaded_fmt
-                    img_options.ExportRange = DB.ExportRange.SetOfViews
+                    file_base = folder_prefix + filename
+                    img_options.FilePath = file_base
 
                     # Set the view IDs using System.Collections.Generic.List
-                    view_ids = List[DB.ElementId]()
+                    view_ids.Clear()
                     view_ids.Add(element.Id)
                     img_options.SetViewsAndSheets(view_ids)
 
                     # Export using Revit's native image export
                     self.doc.ExportImage(img_options)
 
-                    # Wait briefly for file system to update
-                    time.sleep(0.3)
-
                     # Get list of image files after export
-                    current_images = set(glob.glob(os.path.join(output_folder, "*.png")))
+                    current_images = set(glob.glob(png_pattern))
                     new_images = current_images - existing_images
 
                     # Verify file was created
-                    expected_file = os.path.join(output_folder, filename + ".png")
+                    expected_file = file_base + ".png"
 
                     # Handle Revit's automatic filename modification
                     # Revit adds " - Sheet - " or similar to filenames, so we need to rename
-                    if new_images:
+                    created = expected_file in current_images
+                    if new_images and not created:
                         # Get the actual file created by Revit
                         actual_file = list(new_images)[0]
 
-                        # If the actual file is different from expected, rename it
-                        if actual_file != expected_file:
-                            try:
-                                # Rename to the expected filename
-                                os.rename(actual_file, expected_file)
-                            except Exception as rename_ex:
-                                logger.warning("Could not rename {} to {}: {}".format(
-                                    os.path.basename(actual_file),
-                                    os.path.basename(expected_file),
-                                    rename_ex
-                                ))
-
-                    if os.path.exists(expected_file):
+                        # The actual file is different from expected, rename it
+                        try:
+                            # Rename to the expected filename
+                            os.rename(actual_file, expected_file)
+                            created = True
+                        except Exception as rename_ex:
+                            logger.warning("Could not rename {} to {}: {}".format(
+                                os.path.basename(actual_file),
+                                os.path.basename(expected_file),
+                                rename_ex
+                            ))
+
+                    # The listing above already tells whether the file exists; no extra stat
+                    if created:
                         exported_count += 1
                         # Update progress for this export item
                         self.update_export_item_progress(item.SheetNumber, "IMG", 100)